@@ -3,16 +3,27 @@ from __future__ import annotations
 import sys
 import uuid
 import time
+import random
 import boto3
 import pandas as pd
 from pathlib import Path
 from botocore.paginate import PageIterator
 
-from pyllas.sql import infuse, load_query
+from pyllas.sql import prepare_query
 from pyllas.utils import logger
 from pyllas.storage.s3 import S3Client, S3Path
 from pyllas.utils.progress_bar import ProgressBar
 
+_CREATE_TABLE_DDL = """
+  CREATE TABLE {name}
+  WITH (
+    format = 'ORC',
+    external_location = '{path}'
+  )
+  AS
+  {query}
+"""
+
 
 class Athena:
     """
@@ -24,7 +35,7 @@ class Athena:
         :param s3_output_location: S3 path to store query results
         :param n_jobs: number of parallel jobs to read query results, default: 1.
                n_jobs=1, then use only main-threaded
-               n_jobs=-1, then use all available CPUs
+               n_jobs=-1, then use 4 threads per available CPU, at most 32
         :param debug: enable logging debug level
     """
 
@@ -60,7 +71,7 @@ class Athena:
         :param date_fields: tuple or list
                field names to convert to pandas.datetime. Default: ('date', 'event_date', 'report_date')
         :param ask_status_sec: int
-               interval in seconds to check query status. Default: 5
+               maximum interval in seconds to check query status. Default: 5
         """
         date_fields = tuple(date_fields if date_fields else ())
         query_name = self.create_table(query=query, params=params, ask_status_sec=ask_status_sec)
@@ -72,8 +83,8 @@ class Athena:
             dataframe = self._s3.read_orc(query_path, n_jobs=self.n_jobs, progress=progress)
 
         for date_field in date_fields:
-            if date_field in dataframe:
-                dataframe[date_field] = pd.to_datetime(dataframe[date_field])
+            if date_field in dataframe and not pd.api.types.is_datetime64_any_dtype(dataframe[date_field]):
+                dataframe[date_field] = pd.to_datetime(dataframe[date_field], cache=True)
 
         self._logger.info(f'Load query results time: {round(time.time() - begin_time)} sec')
 
@@ -98,9 +109,9 @@ class Athena:
         :param overwrite: bool
             overwrite table if it exists. Default: False
         :param ask_status_sec: int
-            interval in seconds to check query status. Default: 5
+            maximum interval in seconds to check query status. Default: 5
         """
-        query = load_query(query, params) if type(query) is Path else infuse(query, params)
+        query = prepare_query(query, params)
         table_name = name or f'{prefix}{uuid.uuid4()}'.replace('-', '_')
 
         query_name = f'{self.workgroup}.{table_name}'
@@ -111,15 +122,7 @@ class Athena:
             self.__drop_table(query_name, ask_status_sec)
             self._s3.delete(query_path)
 
-        query = f"""
-          CREATE TABLE {query_name}
-          WITH (
-            format = 'ORC',
-            external_location = '{query_path}'
-          )
-          AS 
-          {query}
-        """
+        query = _CREATE_TABLE_DDL.format_map({'name': query_name, 'path': query_path, 'query': query})
 
         self._logger.debug(query)
 
@@ -158,10 +161,10 @@ class Athena:
         :param batch_size: int
             batch size to read query results. Default: 1000
         :param ask_status_sec: int
-            interval in seconds to check query status. Default: 5
+            maximum interval in seconds to check query status. Default: 5
         """
         database = database or self.workgroup
-        query = load_query(query, params) if type(query) is Path else infuse(query, params)
+        query = prepare_query(query, params)
 
         query_id = self._athena.start_query_execution(
             QueryString=query,
@@ -201,6 +204,7 @@ class Athena:
 
     def __wait_query_complete(self, query_id: str, ask_status_sec: int):
         """Wait query to complete and return response."""
+        delay = 0.2
         with ProgressBar() as progress:
             while True:
                 try:
@@ -209,7 +213,8 @@ class Athena:
                     state = status['State']
 
                     if state in ['QUEUED', 'RUNNING']:
-                        time.sleep(ask_status_sec)
+                        time.sleep(delay + random.uniform(0, 0.1 * delay))
+                        delay = min(ask_status_sec, delay * 1.5)
                         progress.tick()
                     elif state == 'SUCCEEDED':
                         return response
@@ -1,4 +1,8 @@
+import re
 from pathlib import Path
+from functools import lru_cache, singledispatch
+
+_PARAM_PATTERN = re.compile(r'\$\{([^}]+)\}')
 
 
 def infuse(string: str, params: dict) -> str:
@@ -27,27 +31,68 @@ def infuse(string: str, params: dict) -> str:
     if not params:
         return string
 
-    result = string
-    for key, value in params.items():
-        new_value = value
+    try:
+        return _infuse_cached(string, tuple(sorted(params.items())))
+    except TypeError:  # unhashable parameter values, e.g. lists
+        return _infuse(string, params)
+
+
+@lru_cache(maxsize=128)
+def _infuse_cached(string: str, params_items: tuple) -> str:
+    return _infuse(string, dict(params_items))
+
+
+def _infuse(string: str, params: dict) -> str:
+    params = {str(key): value for key, value in params.items()}
+
+    def substitute(match: re.Match) -> str:
+        key = match.group(1)
+
+        return _render(params[key]) if key in params else match.group(0)
+
+    return _PARAM_PATTERN.sub(substitute, string)
+
+
+@singledispatch
+def _render(value) -> str:
+    return str(value)
 
-        if type(value) is list:
-            new_value = ','.join([f"'{val}'" for val in value])
-        elif type(value) is str:
-            new_value = f"'{value}'"
 
-        result = result.replace(
-            '${%s}' % key,
-            str(new_value)
-        )
+@_render.register
+def _(value: list) -> str:
+    return ','.join([f"'{val}'" for val in value])
 
-    return result
+
+@_render.register
+def _(value: str) -> str:
+    return f"'{value}'"
+
+
+@lru_cache(maxsize=128)
+def _read_file(path: str, mtime: float) -> str:
+    with open(path) as file:
+        return file.read()
 
 
 def load_query(path: Path, params: dict = None) -> str:
     """Load a query from the resources folder and replace params in it."""
-    with path.open() as query:
-        return infuse(query.read(), params)
+    return infuse(_read_file(str(path), path.stat().st_mtime), params)
+
+
+@singledispatch
+def prepare_query(query, params: dict = None) -> str:
+    """Turn a query string or sql file path into an executable query, see :func: infuse."""
+    raise TypeError(f"Unsupported query type: {type(query)}")
+
+
+@prepare_query.register
+def _(query: str, params: dict = None) -> str:
+    return infuse(query, params)
+
+
+@prepare_query.register
+def _(query: Path, params: dict = None) -> str:
+    return load_query(query, params)
 
 
 class Expr:
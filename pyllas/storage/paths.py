@@ -3,28 +3,29 @@ from __future__ import annotations
 from typing import Callable
 
 import re
-from copy import deepcopy
 from datetime import datetime
+from functools import cached_property
 
 
 class Path:
 
     def __init__(self, path: str = '', parts=None):
-        parts = parts or []
-        if path:
-            parts.append(path)
+        if parts:
+            joined = ''
+            for part in parts:
+                joined = self.__canon(joined, part)
+            path = self.__canon(joined, path) if path else joined
 
-        self.parts = parts
+        self._str = path
 
-    def resolve(self, prefix: str | Path) -> Path:
-        parts = deepcopy(self.parts)
+    @cached_property
+    def parts(self) -> tuple[str, ...]:
+        return tuple(self._str.split('/'))
 
-        if type(prefix) is Path:
-            parts.extend(prefix.parts)
-        else:
-            parts.append(prefix)
+    def resolve(self, prefix: str | Path) -> Path:
+        prefix = prefix.as_str() if isinstance(prefix, Path) else prefix
 
-        return Path(parts=parts)
+        return Path(self.__canon(self._str, prefix))
 
     def format(self, pattern_prefix: str, value: datetime) -> Path:
         return self.resolve(value.strftime(pattern_prefix))
@@ -36,18 +37,14 @@ class Path:
         return self.map(lambda path: self.__remove_suffix(path, '/'))
 
     def as_str(self) -> str:
-        parts = deepcopy(self.parts)
-        if len(parts) > 1:
-            first = self.__remove_suffix(parts.pop(0), '/')
-            last = self.__remove_prefix(parts.pop(), '/')
-
-            parts = (part.strip('/') for part in parts)
-            parts = list(filter(lambda part: len(part) > 0, parts))
+        return self._str
 
-            parts.insert(0, first)
-            parts.append(last)
+    @classmethod
+    def __canon(cls, base: str, part: str) -> str:
+        if not base:
+            return part
 
-        return '/'.join(parts)
+        return f"{cls.__remove_suffix(base, '/')}/{cls.__remove_prefix(part, '/')}"
 
     @staticmethod
     def root():
@@ -78,7 +75,7 @@ class Path:
 
     @staticmethod
     def __remove_prefix(line: str, prefix: str) -> str:
-        return line[1:] if line.endswith(prefix) else line
+        return line[1:] if line.startswith(prefix) else line
 
     @staticmethod
     def __remove_suffix(line: str, suffix: str) -> str:
@@ -86,10 +83,10 @@ class Path:
 
 
 class S3Path:
-    EXTRACT_PATTERN = 's3a?://(?P<bucket>[a-z\\d.-]*)/?(?P<prefix>.*)'
+    EXTRACT_PATTERN = re.compile('s3a?://(?P<bucket>[a-z\\d.-]*)/?(?P<prefix>.*)')
 
     def __init__(self, path: str):
-        result = re.search(S3Path.EXTRACT_PATTERN, path)
+        result = S3Path.EXTRACT_PATTERN.match(path)
         if not result:
             raise ValueError(f"Provided path('{path}') can't be parsed correctly!")
 
@@ -101,14 +98,18 @@ class S3Path:
         return S3Path(str(self.path.drop_tail_slash()))
 
     def resolve(self, prefix: str | Path) -> S3Path:
-        path = self.path.resolve(prefix)
+        resolved = object.__new__(S3Path)
+        resolved.path = self.path.resolve(prefix)
+        resolved.bucket = self.bucket
+        # the scheme and bucket head keeps its length across resolve, so the
+        # new prefix can be sliced off without re-running the regex
+        head = len(self.path.as_str()) - len(self.prefix)
+        resolved.prefix = resolved.path.as_str()[head:].lstrip('/')
 
-        return S3Path(str(path))
+        return resolved
 
     def format(self, pattern_prefix: str, value: datetime) -> S3Path:
-        path = self.path.format(pattern_prefix, value)
-
-        return S3Path(str(path))
+        return self.resolve(value.strftime(pattern_prefix))
 
     def map(self, func: Callable[[str], str]) -> S3Path:
         return S3Path(str(self.path.map(func)))
@@ -2,20 +2,38 @@ from __future__ import annotations
 
 import io
 import os
-import time
 import gzip
 import boto3
+import botocore.session
 import pandas as pd
+from botocore.config import Config
+
+try:
+    from s3transfer.crt import (
+        BotocoreCRTCredentialsWrapper,
+        BotocoreCRTRequestSerializer,
+        CRTTransferManager,
+        create_s3_crt_client,
+    )
+except ImportError:  # awscrt is an optional dependency
+    CRTTransferManager = None
 from typing import Generator
-from functools import partial
-from multiprocessing.pool import ThreadPool
-from pyarrow import orc, concat_tables
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pyarrow import fs, orc, RecordBatch, Table
+from pyarrow import dataset as ds
 
 from pyllas.storage.paths import S3Path
 from pyllas.utils import logger
 from pyllas.utils.progress_bar import ProgressBar
 
 
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS and Windows
+        return os.cpu_count() or 1
+
+
 class S3Client:
     """S3 client for reading and writing data to S3.
     Takes arguments:
@@ -24,18 +42,24 @@ class S3Client:
 
     def __init__(self, debug: bool = False):
         self._logger = logger.get_logger(name='pyllas.S3Client', log_level='DEBUG' if debug else 'INFO')
-        self.s3 = boto3.client('s3')
-        self.s3_resource = boto3.resource('s3')
-
-    def list_objects(self, path: S3Path, *, lazy=False) -> list[dict]:
-        objects_seq = self.s3_resource.Bucket(path.bucket).objects.filter(Prefix=path.prefix)
-        if lazy:
-            return objects_seq
-
-        return list(objects_seq)
+        self.s3 = boto3.client('s3', config=Config(
+            max_pool_connections=32,
+            retries={'mode': 'adaptive'}
+        ))
+        self._fs = fs.S3FileSystem()
+        self._transfer_manager = self.__create_crt_transfer_manager()
+
+    def list_objects(self, path: S3Path) -> Generator[dict, None, None]:
+        pages = self.s3.get_paginator('list_objects_v2').paginate(
+            Bucket=path.bucket,
+            Prefix=path.prefix,
+            PaginationConfig={'PageSize': 1000}
+        )
+        for page in pages:
+            yield from page.get('Contents', [])
 
     def list_paths(self, path: S3Path) -> Generator[S3Path, None, None]:
-        return (S3Path(f's3://{ob.bucket_name}/{ob.key}') for ob in self.list_objects(path))
+        return (S3Path(f's3://{path.bucket}/{ob["Key"]}') for ob in self.list_objects(path))
 
     def get_object(self, path: S3Path) -> dict:
         return self.s3.get_object(Bucket=path.bucket, Key=path.prefix)
@@ -45,16 +69,31 @@ class S3Client:
         Takes arguments:
           - object_path: path to the object in S3.
         """
-        data = self.get_object(object_path)['Body'].read()
+        if gzipped:
+            with gzip.GzipFile(fileobj=self.get_object(object_path)['Body']) as file:
+                return file.read()
+
+        if self._transfer_manager:
+            with io.BytesIO() as buffer:
+                self._transfer_manager.download(object_path.bucket, object_path.prefix, buffer).result()
+                return buffer.getvalue()
 
-        return gzip.decompress(data) if gzipped else data
+        return self.get_object(object_path)['Body'].read()
 
     def delete(self, path: S3Path) -> None:
         """Deletes all objects by path.
         Takes arguments:
           - path: path to the object or "folder" in S3.
         """
-        self.list_objects(path, lazy=True).delete()
+        batch = []
+        for ob in self.list_objects(path):
+            batch.append({'Key': ob['Key']})
+            if len(batch) == 1000:
+                self.s3.delete_objects(Bucket=path.bucket, Delete={'Objects': batch})
+                batch = []
+
+        if batch:
+            self.s3.delete_objects(Bucket=path.bucket, Delete={'Objects': batch})
 
     def read_orc(self, path: S3Path, *, n_jobs: int = 1, gzipped=False, progress: ProgressBar = None) -> pd.DataFrame:
         """Reads orc object(s) from S3 and returns result as a pyarrow.Table.
@@ -63,33 +102,66 @@ class S3Client:
           - gzipped: if True, decompresses data with gzip. Default: False.
         """
 
-        def run_concurrently(threads: int) -> list[orc.Table]:
+        def run_concurrently(threads: int) -> list[RecordBatch]:
             self._logger.info(f'Mode: multithreading ({threads})')
-            with ThreadPool(threads) as pool:
-                feature = pool.map_async(
-                    partial(S3Client._load_orc_table, gzipped=gzipped),
-                    self.list_paths(path)
-                )
-                while progress and not feature.ready():
-                    progress.tick()
-                    time.sleep(5)
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                futures = [
+                    executor.submit(self._load_orc_batches, p, gzipped=gzipped)
+                    for p in self.list_paths(path)
+                ]
+
+                batches = []
+                for future in as_completed(futures):
+                    batches.extend(future.result())
+                    if progress:
+                        progress.tick()
 
-                return feature.get()
+                return batches
 
-        def run_sequentially() -> list[orc.Table]:
+        def run_sequentially() -> Generator[RecordBatch, None, None]:
             self._logger.info('Mode: sequential')
             for p in self.list_paths(path):
-                yield S3Client._load_orc_table(p, gzipped=gzipped)
-                progress.tick()
+                yield from self._load_orc_batches(p, gzipped=gzipped)
+                if progress:
+                    progress.tick()
 
-        tables = list(run_sequentially()) \
+        batches = list(run_sequentially()) \
             if n_jobs == 1 \
-            else run_concurrently(threads=os.cpu_count() if n_jobs == -1 else n_jobs)
+            else run_concurrently(threads=n_jobs if n_jobs > 0 else min(32, _available_cpus() * 4))
+
+        return Table.from_batches(batches).to_pandas(self_destruct=True, split_blocks=True) if batches else pd.DataFrame()
+
+    def _load_orc_batches(self, object_path: S3Path, *, gzipped=False) -> list[RecordBatch]:
+        if gzipped:
+            data = self.read_object(object_path, gzipped=True)
+            with io.BytesIO(data) as buffer:
+                file = orc.ORCFile(buffer)
+                if file.nstripes == 0:  # keep the schema of empty results
+                    return [RecordBatch.from_pydict({name: [] for name in file.schema.names}, schema=file.schema)]
+
+                return [file.read_stripe(stripe) for stripe in range(file.nstripes)]
 
-        return concat_tables(tables).to_pandas() if tables else pd.DataFrame()
+        return list(ds.dataset(
+            f'{object_path.bucket}/{object_path.prefix}',
+            format=ds.OrcFileFormat(),
+            filesystem=self._fs
+        ).to_batches())
 
     @staticmethod
-    def _load_orc_table(object_path: S3Path, *, gzipped=False) -> orc.Table:
-        data = S3Client().read_object(object_path, gzipped=gzipped)
-        with io.BytesIO(data) as buffer:
-            return orc.ORCFile(buffer).read()
+    def __create_crt_transfer_manager() -> CRTTransferManager | None:
+        """Build an AWS CRT transfer manager when `awscrt` is installed, otherwise return None."""
+        if CRTTransferManager is None:
+            return None
+
+        session = botocore.session.Session()
+        region = session.get_config_variable('region')
+        credentials = session.get_credentials()
+        if not region or not credentials:
+            return None
+
+        crt_client = create_s3_crt_client(
+            region=region,
+            crt_credentials_provider=BotocoreCRTCredentialsWrapper(credentials).to_crt_credentials_provider()
+        )
+
+        return CRTTransferManager(crt_client, BotocoreCRTRequestSerializer(session))
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from pyllas.storage.paths import Path, S3Path
+
+
+def test_resolve_joins_segments():
+    assert str(Path('a') / 'b' / 'c') == 'a/b/c'
+    assert str(Path('a/') / 'b') == 'a/b'
+    assert str(Path('a') / '/b') == 'a/b'
+
+
+def test_resolve_keeps_trailing_slash_segments():
+    assert str(Path('a') / 'b/' / 'c') == 'a/b/c'
+    assert str(Path('s3://bkt') / 'part=1/' / 'file.orc') == 's3://bkt/part=1/file.orc'
+
+
+def test_format_with_trailing_slash_pattern():
+    path = Path('s3://bkt') % ('dt=%Y-%m-%d/', datetime(2024, 3, 2))
+
+    assert str(path / 'file.orc') == 's3://bkt/dt=2024-03-02/file.orc'
+
+
+def test_s3_path_resolve_tracks_bucket_and_prefix():
+    path = S3Path('s3://bucket/a/') / 'b/' / 'c'
+
+    assert str(path) == 's3://bucket/a/b/c'
+    assert path.bucket == 'bucket'
+    assert path.prefix == 'a/b/c'
+
+
+def test_s3_path_resolve_from_bare_bucket():
+    path = S3Path('s3://bucket') / 'x/'
+
+    assert path.bucket == 'bucket'
+    assert path.prefix == 'x/'